@@ -1,9 +1,49 @@
+import asyncio
+import re
+from functools import lru_cache
 import gradio as gr
 from typing import Dict, Any, List, Tuple
 
+# All wait patterns fused into one alternation, most specific first so earlier branches win
+_WAIT_PATTERNS = re.compile(
+    r"(?P<wait_its_should>cy\.wait\('@(?P<should_alias>[^'\"]+)'\)\.its\('response\.statusCode'\)"
+    r"\.should\('eq',\s*(?P<status_code>\d+)\))"
+    r"|(?P<wait_its>cy\.wait\('@(?P<its_alias>[^'\"]+)'\)\.its\('response\.statusCode'\))"
+    r"|(?P<wait_alias>cy\.wait\('@(?P<alias>[^'\"]+)'\))"
+    r"|(?P<wait_number>cy\.wait\((?P<ms>\d+)\))"
+    r"|(?P<wait_until>cy\.waitUntil\(\(\) => (?P<condition>[^)]+)\))"
+)
+
+def _alias_wait(alias: str) -> str:
+    """Convert cy.wait('@alias') to an appropriate Playwright wait based on common alias names"""
+    if 'api' in alias.lower() or 'request' in alias.lower() or 'get' in alias.lower():
+        return f"await page.waitForResponse('**/*{alias.replace('get', '').replace('api', '').replace('data', '').lower()}*')"
+    return f"await page.waitForResponse('**/{alias}**')"
+
+def _convert_wait(match: re.Match) -> Tuple[str, str]:
+    """Playwright replacement (and explanation note) for one _WAIT_PATTERNS match"""
+    kind = match.lastgroup
+    if kind == "wait_its_should":
+        # cy.wait('@alias').its('response.statusCode').should('eq', number)
+        return (f"expect((await page.waitForResponse('**/{match['should_alias']}**')).status())"
+                f".toBe({match['status_code']})"), ""
+    if kind == "wait_its":
+        # cy.wait('@alias').its('response.statusCode')
+        return f"(await page.waitForResponse('**/{match['its_alias']}**')).status()", ""
+    if kind == "wait_alias":
+        # cy.wait('@alias') - complex network waiting
+        return _alias_wait(match['alias']), ""
+    if kind == "wait_number":
+        # cy.wait(number) - fixed waits
+        return f"await page.waitForTimeout({match['ms']})", " (consider using auto-wait instead)"
+    # cy.waitUntil (if using cypress-wait-until plugin)
+    return f"await page.waitForFunction(() => {match['condition']})", ""
+
 def create_migration_interface() -> gr.Interface:
     """Create the Cypress to Playwright migration interface"""
     
+    # Conversion is a pure function of its two strings, so repeated snippets are served from the cache
+    @lru_cache(maxsize=1024)
     def convert_cypress_code(cypress_code: str, conversion_type: str) -> Tuple[str, str]:
         """Convert Cypress code to Playwright"""
         
@@ -270,45 +310,13 @@ def create_migration_interface() -> gr.Interface:
             code = code.replace(old_pattern, new_pattern)
             explanations.append(f"• {old_pattern} → {new_pattern}")
         
-        # Handle cy.wait('@alias').its('response.statusCode').should('eq', number) patterns first (most specific)
-        wait_its_should_pattern = r"cy\.wait\('@([^'\"]+)'\)\.its\('response\.statusCode'\)\.should\('eq',\s*(\d+)\)"
-        matches = re.findall(wait_its_should_pattern, code)
-        for alias, status_code in matches:
-            old_pattern = f"cy.wait('@{alias}').its('response.statusCode').should('eq', {status_code})"
-            new_pattern = f"expect((await page.waitForResponse('**/{alias}**')).status()).toBe({status_code})"
-            code = code.replace(old_pattern, new_pattern)
-            explanations.append(f"• {old_pattern} → {new_pattern}")
-        
-        # Handle cy.wait('@alias').its('response.statusCode') patterns
-        wait_its_pattern = r"cy\.wait\('@([^'\"]+)'\)\.its\('response\.statusCode'\)"
-        matches = re.findall(wait_its_pattern, code)
-        for match in matches:
-            old_pattern = f"cy.wait('@{match}').its('response.statusCode')"
-            new_pattern = f"(await page.waitForResponse('**/{match}**')).status()"
-            code = code.replace(old_pattern, new_pattern)
-            explanations.append(f"• {old_pattern} → {new_pattern}")
+        # Handle every cy.wait()/cy.waitUntil() pattern in one pass (see _WAIT_PATTERNS for precedence)
+        def dispatch_wait(match):
+            new_pattern, note = _convert_wait(match)
+            explanations.append(f"• {match.group(0)} → {new_pattern}{note}")
+            return new_pattern
         
-        # Handle cy.wait('@alias') patterns - complex network waiting (after .its patterns)
-        wait_alias_pattern = r"cy\.wait\('@([^'\"]+)'\)"
-        matches = re.findall(wait_alias_pattern, code)
-        for match in matches:
-            old_pattern = f"cy.wait('@{match}')"
-            # Convert to appropriate Playwright wait based on common patterns
-            if 'api' in match.lower() or 'request' in match.lower() or 'get' in match.lower():
-                new_pattern = f"await page.waitForResponse('**/*{match.replace('get', '').replace('api', '').replace('data', '').lower()}*')"
-            else:
-                new_pattern = f"await page.waitForResponse('**/{match}**')"
-            code = code.replace(old_pattern, new_pattern)
-            explanations.append(f"• {old_pattern} → {new_pattern}")
-        
-        # Handle cy.wait(number) patterns - fixed waits
-        wait_number_pattern = r"cy\.wait\((\d+)\)"
-        matches = re.findall(wait_number_pattern, code)
-        for match in matches:
-            old_pattern = f"cy.wait({match})"
-            new_pattern = f"await page.waitForTimeout({match})"
-            code = code.replace(old_pattern, new_pattern)
-            explanations.append(f"• {old_pattern} → {new_pattern} (consider using auto-wait instead)")
+        code = _WAIT_PATTERNS.sub(dispatch_wait, code)
         
         # Handle remaining .its('response.statusCode') patterns that might be left
         its_response_pattern = r"\.its\('response\.statusCode'\)"
@@ -334,15 +342,6 @@ def create_migration_interface() -> gr.Interface:
             code = code.replace(old_pattern, new_pattern)
             explanations.append(f"• {old_pattern} → {new_pattern} (direct comparison)")
         
-        # Handle cy.waitUntil patterns (if using cypress-wait-until plugin)
-        wait_until_pattern = r"cy\.waitUntil\(\(\) => ([^)]+)\)"
-        matches = re.findall(wait_until_pattern, code)
-        for match in matches:
-            old_pattern = f"cy.waitUntil(() => {match})"
-            new_pattern = f"await page.waitForFunction(() => {match})"
-            code = code.replace(old_pattern, new_pattern)
-            explanations.append(f"• {old_pattern} → {new_pattern}")
-        
         # Handle .as('alias') patterns
         alias_pattern = r"\.as\(['\"]([^'\"]+)['\"]\)"
         matches = re.findall(alias_pattern, code)
@@ -1627,16 +1626,21 @@ const testRunner = new TestRunner(new MySQLDatabase());
     
     return interface
 
+# Chat requests Gradio runs at once; matches KimiAIService's batch size (_BATCH_MAX_SIZE)
+_CHAT_CONCURRENCY = 8
+
 def create_ai_chat_interface() -> gr.Interface:
     """Create the AI-powered chat interface"""
     
-    def chat_with_ai(message: str, history: List[List[str]]) -> Tuple[str, List[List[str]]]:
+    async def chat_with_ai(message: str, history: List[List[str]]) -> Tuple[str, List[List[str]]]:
         """Chat with the AI assistant"""
         
         # Import AI service
         try:
-            from services.ai_service import ai_service
-            response = ai_service.generate_response(message)
+            from services.ai_service import get_ai_service
+            # The first call loads the model; keep that off the event loop
+            ai_service = await asyncio.to_thread(get_ai_service)
+            response = await ai_service.generate_response(message)
         except Exception as e:
             response = f"I'm here to help with Playwright questions! Please ask about:\n\n" \
                       f"• Cypress to Playwright migration\n" \
@@ -1669,17 +1673,21 @@ def create_ai_chat_interface() -> gr.Interface:
         
         clear_btn = gr.Button("Clear Chat")
         
-        # Event handlers
+        # Event handlers; both share one concurrency pool so concurrent questions can be batched
         send_btn.click(
             fn=chat_with_ai,
             inputs=[msg, chatbot],
-            outputs=[msg, chatbot]
+            outputs=[msg, chatbot],
+            concurrency_limit=_CHAT_CONCURRENCY,
+            concurrency_id="ai_chat"
         )
         
         msg.submit(
             fn=chat_with_ai,
             inputs=[msg, chatbot],
-            outputs=[msg, chatbot]
+            outputs=[msg, chatbot],
+            concurrency_limit=_CHAT_CONCURRENCY,
+            concurrency_id="ai_chat"
         )
         
         clear_btn.click(
@@ -1,7 +1,8 @@
+import importlib
+
 from .migration_guide import get_migration_guide
 from .best_practices import get_best_practices_guide
 from .oop_principles import get_oop_guide
-from .solid_principles import get_solid_guide
 from .framework_best_practices import get_framework_best_practices
 
 __all__ = [
@@ -11,3 +12,12 @@ __all__ = [
     "get_solid_guide",
     "get_framework_best_practices"
 ]
+
+def __getattr__(name):
+    """Import solid_principles on first access instead of at package import"""
+    if name in ("solid_principles", "get_solid_guide"):
+        module = importlib.import_module(".solid_principles", __name__)
+        globals()["solid_principles"] = module
+        globals()["get_solid_guide"] = module.get_solid_guide
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -5,6 +5,10 @@ Playwright Best Practices Guide
 Comprehensive guide covering Playwright testing best practices.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
 # Page Object Model best practices
 PAGE_OBJECT_MODEL = {
     "basic_example": """
@@ -211,13 +215,14 @@ jobs:
     ]
 }
 
-def get_best_practices_guide():
-    """Get the complete best practices guide"""
-    return {
+@lru_cache(maxsize=1)
+def get_best_practices_guide() -> Mapping[str, Any]:
+    """Get the complete best practices guide (built once, read-only)"""
+    return MappingProxyType({
         "page_object_model": PAGE_OBJECT_MODEL,
         "selector_strategies": SELECTOR_STRATEGIES,
         "test_organization": TEST_ORGANIZATION,
         "error_handling": ERROR_HANDLING,
         "parallel_execution": PARALLEL_EXECUTION,
         "cicd_integration": CICD_INTEGRATION
-    }
+    })
@@ -0,0 +1,24 @@
+// Good encapsulation
+class LoginForm {
+  constructor(page) {
+    this.page = page;
+    this._usernameField = page.locator('#username');
+    this._passwordField = page.locator('#password');
+    this._submitButton = page.locator('#login');
+  }
+
+  async login(credentials) {
+    await this._fillCredentials(credentials);
+    await this._submit();
+  }
+
+  // Private methods
+  async _fillCredentials({ username, password }) {
+    await this._usernameField.fill(username);
+    await this._passwordField.fill(password);
+  }
+
+  async _submit() {
+    await this._submitButton.click();
+  }
+}
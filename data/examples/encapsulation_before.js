@@ -0,0 +1,14 @@
+// Poor encapsulation
+class TestPage {
+  constructor(page) {
+    this.page = page;
+    this.username = page.locator('#username');
+    this.password = page.locator('#password');
+  }
+
+  async doLogin(user, pass) {
+    await this.username.fill(user);
+    await this.password.fill(pass);
+    await this.page.click('#login');
+  }
+}
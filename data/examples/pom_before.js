@@ -0,0 +1,7 @@
+// Without Page Object Model
+test('login test', async ({ page }) => {
+  await page.goto('/login');
+  await page.fill('#username', 'user');
+  await page.fill('#password', 'pass');
+  await page.click('#login-btn');
+});
@@ -0,0 +1,33 @@
+// Follows SRP - single responsibility per class
+class UserPage {
+  constructor(page) {
+    this.page = page;
+  }
+
+  async login(email, password) {
+    await this.page.fill('#email', email);
+    await this.page.fill('#password', password);
+    await this.page.click('#login');
+  }
+}
+
+class UserRepository {
+  async createUser(userData) {
+    // Database operations only
+    return await this.database.users.create(userData);
+  }
+}
+
+class EmailValidator {
+  static validate(email) {
+    // Validation logic only
+    return email.includes('@') && email.includes('.');
+  }
+}
+
+class TestReporter {
+  generateReport(results) {
+    // Reporting logic only
+    return { summary: results.length, passed: results.filter(r => r.passed).length };
+  }
+}
@@ -0,0 +1,28 @@
+// Violates SRP - multiple responsibilities
+class UserTestManager {
+  constructor(page) {
+    this.page = page;
+  }
+
+  async createUser(userData) {
+    // Database logic
+    await this.saveToDatabase(userData);
+  }
+
+  async loginUser(email, password) {
+    // UI interaction logic
+    await this.page.fill('#email', email);
+    await this.page.fill('#password', password);
+    await this.page.click('#login');
+  }
+
+  async validateEmail(email) {
+    // Validation logic
+    return email.includes('@');
+  }
+
+  async generateReport() {
+    // Reporting logic
+    return 'Test Report';
+  }
+}
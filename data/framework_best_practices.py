@@ -5,6 +5,10 @@ Test Automation Framework Best Practices
 Comprehensive guide covering best practices for building robust test automation frameworks.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
 # Framework Architecture Patterns
 ARCHITECTURE_PATTERNS = {
     "layered_architecture": """
@@ -445,12 +449,13 @@ Environment: ${process.env.NODE_ENV || 'development'}
 """
 }
 
-def get_framework_best_practices():
-    """Get the complete framework best practices guide"""
-    return {
+@lru_cache(maxsize=1)
+def get_framework_best_practices() -> Mapping[str, Any]:
+    """Get the complete framework best practices guide (built once, read-only)"""
+    return MappingProxyType({
         "architecture_patterns": ARCHITECTURE_PATTERNS,
         "configuration_management": CONFIGURATION_MANAGEMENT,
         "error_handling": ERROR_HANDLING,
         "reporting_analytics": REPORTING_ANALYTICS,
         "maintenance_scalability": MAINTENANCE_SCALABILITY
-    }
+    })
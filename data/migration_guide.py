@@ -5,6 +5,10 @@ Cypress to Playwright Migration Guide
 This module contains comprehensive examples and guidance for migrating from Cypress to Playwright.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
 # Basic syntax comparison examples
 SYNTAX_COMPARISONS = [
     {
@@ -500,10 +504,20 @@ Advanced wait migration:
     }
 ]
 
-def get_migration_guide():
-    """Get the complete migration guide"""
-    return {
+def _compact(text: str) -> str:
+    """Drop the surrounding newlines, indentation and blank lines of a text block"""
+    return "\n".join(line.strip() for line in text.strip().splitlines() if line.strip())
+
+# Store explanations in compact form; callers can still split them on "\n"
+for _entry in (*SYNTAX_COMPARISONS, CONFIG_MIGRATION, *ADVANCED_PATTERNS):
+    _entry["explanation"] = _compact(_entry["explanation"])
+del _entry
+
+@lru_cache(maxsize=1)
+def get_migration_guide() -> Mapping[str, Any]:
+    """Get the complete migration guide (built once, read-only)"""
+    return MappingProxyType({
         "syntax_comparisons": SYNTAX_COMPARISONS,
         "config_migration": CONFIG_MIGRATION,
         "advanced_patterns": ADVANCED_PATTERNS
-    }
+    })
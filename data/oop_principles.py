@@ -5,6 +5,10 @@ OOP Principles in Test Automation
 Comprehensive guide on applying Object-Oriented Programming principles in test automation.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
 # Encapsulation in Test Design
 ENCAPSULATION = {
     "principle": "Encapsulation hides internal details and exposes only necessary interfaces",
@@ -370,12 +374,19 @@ const dashboardPage = PageFactory.createPage('dashboard', page);
 """
 }
 
-def get_oop_guide():
-    """Get the complete OOP principles guide"""
-    return {
+# Benefit sets for constant-time membership checks (keep the lists for ordered display)
+ENCAPSULATION_BENEFITS = frozenset(ENCAPSULATION["benefits"])
+INHERITANCE_BENEFITS = frozenset(INHERITANCE["benefits"])
+POLYMORPHISM_BENEFITS = frozenset(POLYMORPHISM["benefits"])
+ABSTRACTION_BENEFITS = frozenset(ABSTRACTION["benefits"])
+
+@lru_cache(maxsize=1)
+def get_oop_guide() -> Mapping[str, Any]:
+    """Get the complete OOP principles guide (built once, read-only)"""
+    return MappingProxyType({
         "encapsulation": ENCAPSULATION,
         "inheritance": INHERITANCE,
         "polymorphism": POLYMORPHISM,
         "abstraction": ABSTRACTION,
         "design_patterns": DESIGN_PATTERNS
-    }
+    })
@@ -6,16 +6,11 @@ Shows key features and capabilities
 
 import sys
 import os
+from functools import lru_cache
+from typing import Final
 
-# Add current directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-def demo_migration_conversion():
-    """Demonstrate Cypress to Playwright code conversion"""
-    print("🔄 CYPRESS TO PLAYWRIGHT CONVERSION DEMO")
-    print("=" * 50)
-    
-    cypress_code = """
+# Example snippets shown by the demo sections
+_CYPRESS_LOGIN_SNIPPET: Final[str] = """
 describe('Login Tests', () => {
     beforeEach(() => {
         cy.visit('/login');
@@ -29,8 +24,8 @@ describe('Login Tests', () => {
     });
 });
     """
-    
-    playwright_code = """
+
+_PLAYWRIGHT_LOGIN_SNIPPET: Final[str] = """
 import { test, expect } from '@playwright/test';
 
 test.describe('Login Tests', () => {
@@ -46,25 +41,8 @@ test.describe('Login Tests', () => {
     });
 });
     """
-    
-    print("📝 ORIGINAL CYPRESS CODE:")
-    print(cypress_code)
-    print("\n✨ CONVERTED PLAYWRIGHT CODE:")
-    print(playwright_code)
-    print("\n💡 KEY CHANGES:")
-    print("• Added async/await syntax")
-    print("• Changed cy.get() to page.getByTestId()")
-    print("• Updated .type() to .fill()")
-    print("• Modified assertions to expect() syntax")
-    print("• Updated test structure with page parameter")
 
-def demo_best_practices():
-    """Demonstrate Playwright best practices"""
-    print("\n🎯 PLAYWRIGHT BEST PRACTICES DEMO")
-    print("=" * 50)
-    
-    print("📚 PAGE OBJECT MODEL EXAMPLE:")
-    page_object_code = """
+_PAGE_OBJECT_SNIPPET: Final[str] = """
 class LoginPage {
     constructor(page) {
         this.page = page;
@@ -89,22 +67,8 @@ class LoginPage {
 const loginPage = new LoginPage(page);
 await loginPage.login('user@example.com', 'password123');
     """
-    print(page_object_code)
-    
-    print("\n🎯 SELECTOR PRIORITY ORDER:")
-    print("1. getByRole() - Most accessible and resilient")
-    print("2. getByTestId() - Explicit test identifiers")
-    print("3. getByLabel() - Form elements with labels")
-    print("4. getByText() - Unique text content")
-    print("5. CSS selectors - Last resort")
 
-def demo_oop_principles():
-    """Demonstrate OOP principles in test automation"""
-    print("\n🏗️ OOP PRINCIPLES DEMO")
-    print("=" * 50)
-    
-    print("🔒 ENCAPSULATION EXAMPLE:")
-    encapsulation_code = """
+_ENCAPSULATION_SNIPPET: Final[str] = """
 class LoginForm {
     constructor(page) {
         this.page = page;
@@ -135,23 +99,8 @@ class LoginForm {
     }
 }
     """
-    print(encapsulation_code)
-    
-    print("✅ BENEFITS:")
-    print("• Hides implementation details")
-    print("• Provides clean public interface")
-    print("• Reduces coupling between components")
-    print("• Makes code easier to maintain")
 
-def demo_solid_principles():
-    """Demonstrate SOLID principles"""
-    print("\n🔧 SOLID PRINCIPLES DEMO")
-    print("=" * 50)
-    
-    print("1️⃣ SINGLE RESPONSIBILITY PRINCIPLE:")
-    print("Each class should have one reason to change")
-    
-    srp_code = """
+_SRP_SNIPPET: Final[str] = """
 // GOOD: Separate responsibilities
 class UserPage {
     constructor(page) {
@@ -178,17 +127,8 @@ class UserValidator {
     }
 }
     """
-    print(srp_code)
 
-def demo_ai_capabilities():
-    """Demonstrate AI assistant capabilities"""
-    print("\n🤖 AI ASSISTANT DEMO")
-    print("=" * 50)
-    
-    print("💬 EXAMPLE INTERACTIONS:")
-    print("\nQ: How do I convert cy.intercept() to Playwright?")
-    print("A: Use page.route() in Playwright:")
-    print("""
+_INTERCEPT_SNIPPET: Final[str] = """
 // Cypress
 cy.intercept('GET', '/api/users', { fixture: 'users.json' }).as('getUsers');
 
@@ -200,11 +140,9 @@ await page.route('/api/users', route => {
         body: JSON.stringify(testData.users)
     });
 });
-    """)
-    
-    print("\nQ: What's the best way to handle dynamic content?")
-    print("A: Use Playwright's auto-waiting and proper selectors:")
-    print("""
+    """
+
+_DYNAMIC_SNIPPET: Final[str] = """
 // Wait for element to be visible
 await expect(page.locator('.dynamic-content')).toBeVisible();
 
@@ -213,60 +151,148 @@ await expect(page.locator('.status')).toHaveText('Loaded');
 
 // Wait for network requests to complete
 await page.waitForLoadState('networkidle');
-    """)
+    """
+
+# Pre-formatted progress tracking section
+_PROGRESS_LINES: Final[tuple[str, ...]] = (
+    "• Basic Syntax Conversion (30 min) - ✅ Completed",
+    "• Assertion Migration (25 min) - ✅ Completed",
+    "• Configuration Migration (45 min) - 🔄 In Progress (60%)",
+    "• Page Object Model (60 min) - ⏳ Not Started",
+    "• OOP Principles (50 min) - ⏳ Not Started",
+)
+
+_PROGRESS_BLOB: Final[str] = "\n".join([
+    "\n📊 PROGRESS TRACKING DEMO",
+    "=" * 50,
+    "📈 LEARNING MODULES:",
+    *_PROGRESS_LINES,
+    "\n📊 Overall Progress: 2/5 modules completed (40%)",
+    "🎯 Next Recommended: Complete Configuration Migration",
+    "⏰ Estimated Time to Completion: 3.5 hours",
+]) + "\n"
+
+@lru_cache(maxsize=1)
+def demo_migration_conversion():
+    """Demonstrate Cypress to Playwright code conversion"""
+    return "\n".join([
+        "🔄 CYPRESS TO PLAYWRIGHT CONVERSION DEMO",
+        "=" * 50,
+        "📝 ORIGINAL CYPRESS CODE:",
+        _CYPRESS_LOGIN_SNIPPET,
+        "\n✨ CONVERTED PLAYWRIGHT CODE:",
+        _PLAYWRIGHT_LOGIN_SNIPPET,
+        "\n💡 KEY CHANGES:",
+        "• Added async/await syntax",
+        "• Changed cy.get() to page.getByTestId()",
+        "• Updated .type() to .fill()",
+        "• Modified assertions to expect() syntax",
+        "• Updated test structure with page parameter",
+    ]) + "\n"
+
+@lru_cache(maxsize=1)
+def demo_best_practices():
+    """Demonstrate Playwright best practices"""
+    return "\n".join([
+        "\n🎯 PLAYWRIGHT BEST PRACTICES DEMO",
+        "=" * 50,
+        "📚 PAGE OBJECT MODEL EXAMPLE:",
+        _PAGE_OBJECT_SNIPPET,
+        "\n🎯 SELECTOR PRIORITY ORDER:",
+        "1. getByRole() - Most accessible and resilient",
+        "2. getByTestId() - Explicit test identifiers",
+        "3. getByLabel() - Form elements with labels",
+        "4. getByText() - Unique text content",
+        "5. CSS selectors - Last resort",
+    ]) + "\n"
+
+@lru_cache(maxsize=1)
+def demo_oop_principles():
+    """Demonstrate OOP principles in test automation"""
+    return "\n".join([
+        "\n🏗️ OOP PRINCIPLES DEMO",
+        "=" * 50,
+        "🔒 ENCAPSULATION EXAMPLE:",
+        _ENCAPSULATION_SNIPPET,
+        "✅ BENEFITS:",
+        "• Hides implementation details",
+        "• Provides clean public interface",
+        "• Reduces coupling between components",
+        "• Makes code easier to maintain",
+    ]) + "\n"
+
+@lru_cache(maxsize=1)
+def demo_solid_principles():
+    """Demonstrate SOLID principles"""
+    return "\n".join([
+        "\n🔧 SOLID PRINCIPLES DEMO",
+        "=" * 50,
+        "1️⃣ SINGLE RESPONSIBILITY PRINCIPLE:",
+        "Each class should have one reason to change",
+        _SRP_SNIPPET,
+    ]) + "\n"
+
+@lru_cache(maxsize=1)
+def demo_ai_capabilities():
+    """Demonstrate AI assistant capabilities"""
+    return "\n".join([
+        "\n🤖 AI ASSISTANT DEMO",
+        "=" * 50,
+        "💬 EXAMPLE INTERACTIONS:",
+        "\nQ: How do I convert cy.intercept() to Playwright?",
+        "A: Use page.route() in Playwright:",
+        _INTERCEPT_SNIPPET,
+        "\nQ: What's the best way to handle dynamic content?",
+        "A: Use Playwright's auto-waiting and proper selectors:",
+        _DYNAMIC_SNIPPET,
+    ]) + "\n"
 
 def demo_progress_tracking():
     """Demonstrate progress tracking features"""
-    print("\n📊 PROGRESS TRACKING DEMO")
-    print("=" * 50)
-    
-    print("📈 LEARNING MODULES:")
-    modules = [
-        "Basic Syntax Conversion (30 min) - ✅ Completed",
-        "Assertion Migration (25 min) - ✅ Completed", 
-        "Configuration Migration (45 min) - 🔄 In Progress (60%)",
-        "Page Object Model (60 min) - ⏳ Not Started",
-        "OOP Principles (50 min) - ⏳ Not Started"
-    ]
-    
-    for module in modules:
-        print(f"• {module}")
-    
-    print(f"\n📊 Overall Progress: 2/5 modules completed (40%)")
-    print("🎯 Next Recommended: Complete Configuration Migration")
-    print("⏰ Estimated Time to Completion: 3.5 hours")
+    return _PROGRESS_BLOB
+
+@lru_cache(maxsize=1)
+def demo_all():
+    """Render every demo section as a single string"""
+    return (
+        demo_migration_conversion()
+        + demo_best_practices()
+        + demo_oop_principles()
+        + demo_solid_principles()
+        + demo_ai_capabilities()
+        + demo_progress_tracking()
+    )
 
 def main():
     """Run the complete demo"""
-    print("🎭 PLAYWRIGHT STUDIES PORTAL - FEATURE DEMO")
-    print("=" * 60)
-    print("Welcome to the comprehensive demo of our educational portal!")
-    print("This demo showcases all the key features and capabilities.\n")
+    print("\n".join([
+        "🎭 PLAYWRIGHT STUDIES PORTAL - FEATURE DEMO",
+        "=" * 60,
+        "Welcome to the comprehensive demo of our educational portal!",
+        "This demo showcases all the key features and capabilities.\n",
+    ]))
     
     try:
-        demo_migration_conversion()
-        demo_best_practices()
-        demo_oop_principles()
-        demo_solid_principles()
-        demo_ai_capabilities()
-        demo_progress_tracking()
+        sys.stdout.write(demo_all())
         
-        print("\n" + "=" * 60)
-        print("🎉 DEMO COMPLETE!")
-        print("=" * 60)
-        print("🚀 Ready to start learning? Run: python main.py")
-        print("📚 Full portal includes:")
-        print("• Interactive code conversion tools")
-        print("• Comprehensive study guides")  
-        print("• AI-powered assistance")
-        print("• Progress tracking and analytics")
-        print("• Hands-on examples and exercises")
-        print("\n💡 Don't forget to set your HUGGINGFACE_TOKEN in .env for AI features!")
+        print("\n".join([
+            "\n" + "=" * 60,
+            "🎉 DEMO COMPLETE!",
+            "=" * 60,
+            "🚀 Ready to start learning? Run: python main.py",
+            "📚 Full portal includes:",
+            "• Interactive code conversion tools",
+            "• Comprehensive study guides",
+            "• AI-powered assistance",
+            "• Progress tracking and analytics",
+            "• Hands-on examples and exercises",
+            "\n💡 Don't forget to set your HUGGINGFACE_TOKEN in .env for AI features!",
+        ]))
         
     except KeyboardInterrupt:
         print("\n\n👋 Demo interrupted by user. Thanks for watching!")
-    except Exception as e:
-        print(f"\n❌ Demo error: {e}")
 
 if __name__ == "__main__":
+    # Add current directory to Python path
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
     main()
@@ -16,7 +16,7 @@ Features:
 
 import os
 import sys
-import gradio as gr
+from typing import Final
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -25,28 +25,8 @@ load_dotenv()
 # Add current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Initialize database
-try:
-    from models import create_tables
-    create_tables()
-    print("✅ Database initialized successfully")
-except Exception as e:
-    print(f"⚠️ Database initialization warning: {e}")
-
-# Import components
-from components import (
-    create_migration_interface,
-    create_best_practices_interface,
-    create_principles_interface,
-    create_ai_chat_interface,
-    create_architecture_interface
-)
-
-def create_main_app():
-    """Create the main Gradio application with multiple tabs"""
-    
-    # Custom CSS for better styling
-    custom_css = """
+# Page styling and static Markdown for the app layout
+_CUSTOM_CSS: Final[str] = """
     .gradio-container {
         max-width: 1200px !important;
         margin: auto !important;
@@ -72,79 +52,17 @@ def create_main_app():
         margin: 1rem 0;
     }
     """
-    
-    with gr.Blocks(
-        title="Cypress to Playwright Conversion Tool & Playwright Studies Portal",
-        theme=gr.themes.Soft(),
-        css=custom_css
-    ) as app:
-        
-        # Header
-        gr.Markdown("""
+
+_HEADER_MD: Final[str] = """
         # 🎭 Playwright Studies Portal
         
         **Master Playwright Test Automation with AI-Powered Learning**
         
         Learn Playwright through comprehensive guides, hands-on examples, and AI assistance.
         Built with Gradio, SQLAlchemy, and powered by Kimi-K2-Instruct.
-        """, elem_classes="highlight-box")
-        
-        # Create tabbed interface
-        with gr.Tabs():
-            
-            # Migration Tab
-            with gr.Tab("🔄 Cypress → Playwright", id="migration"):
-                gr.Markdown("""
-                ### Convert your Cypress tests to Playwright
-                
-                Get step-by-step guidance, code conversion tools, and migration best practices.
-                """)
-                
-                migration_interface = create_migration_interface()
-            
-            # Best Practices Tab
-            with gr.Tab("🎯 Best Practices", id="best_practices"):
-                gr.Markdown("""
-                ### Learn Playwright testing best practices
-                
-                Explore Page Object Model, selector strategies, test organization, and more.
-                """)
-                
-                best_practices_interface = create_best_practices_interface()
-            
-            # Principles Tab
-            with gr.Tab("🏗️ OOP & SOLID", id="principles"):
-                gr.Markdown("""
-                ### Apply OOP and SOLID principles to test automation
-                
-                Learn how to create maintainable, scalable test frameworks using proven design principles.
-                """)
-                
-                principles_interface = create_principles_interface()
-            
-            # Architecture Analysis Tab
-            with gr.Tab("🔬 Architecture", id="architecture"):
-                gr.Markdown("""
-                ### Deep dive into Playwright's internal architecture
-                
-                Understand the client-server model, communication protocols, and design decisions that make Playwright powerful.
-                """)
-                
-                architecture_interface = create_architecture_interface()
-            
-            # AI Assistant Tab
-            with gr.Tab("🤖 AI Assistant", id="ai_chat"):
-                gr.Markdown("""
-                ### Get personalized help from our AI assistant
-                
-                Ask questions about Playwright, get code examples, and receive expert guidance.
-                """)
-                
-                ai_interface = create_ai_chat_interface()
-            
-            # Resources Tab
-            with gr.Tab("📚 Resources", id="resources"):
-                gr.Markdown("""
+        """
+
+_RESOURCES_MD: Final[str] = """
                 ## 📖 Additional Learning Resources
                 
                 ### Official Documentation
@@ -221,16 +139,106 @@ def create_main_app():
                 - 🎯 Best practices mastered
                 
                 Your progress is automatically saved and can be resumed anytime.
-                """)
-        
-        # Footer
-        gr.Markdown("""
+                """
+
+_FOOTER_MD: Final[str] = """
         ---
         
         **Playwright Studies Portal** | Built with ❤️ using Gradio & SQLAlchemy | Powered by Kimi-K2-Instruct
         
         *Master test automation with modern tools and AI assistance*
-        """, elem_classes="highlight-box")
+        """
+
+def initialize_database():
+    """Create any missing database tables"""
+    try:
+        from models import create_tables
+        create_tables()
+        print("✅ Database initialized successfully")
+    except Exception as e:
+        print(f"⚠️ Database initialization warning: {e}")
+
+def create_main_app():
+    """Create the main Gradio application with multiple tabs"""
+    
+    # Gradio and the UI components are heavy; import them only when building the app
+    import gradio as gr
+    from components import (
+        create_migration_interface,
+        create_best_practices_interface,
+        create_principles_interface,
+        create_ai_chat_interface,
+        create_architecture_interface
+    )
+    
+    with gr.Blocks(
+        title="Cypress to Playwright Conversion Tool & Playwright Studies Portal",
+        theme=gr.themes.Soft(),
+        css=_CUSTOM_CSS
+    ) as app:
+        
+        # Header
+        gr.Markdown(_HEADER_MD, elem_classes="highlight-box")
+        
+        # Create tabbed interface
+        with gr.Tabs():
+            
+            # Migration Tab
+            with gr.Tab("🔄 Cypress → Playwright", id="migration"):
+                gr.Markdown("""
+                ### Convert your Cypress tests to Playwright
+                
+                Get step-by-step guidance, code conversion tools, and migration best practices.
+                """)
+                
+                migration_interface = create_migration_interface()
+            
+            # Best Practices Tab
+            with gr.Tab("🎯 Best Practices", id="best_practices"):
+                gr.Markdown("""
+                ### Learn Playwright testing best practices
+                
+                Explore Page Object Model, selector strategies, test organization, and more.
+                """)
+                
+                best_practices_interface = create_best_practices_interface()
+            
+            # Principles Tab
+            with gr.Tab("🏗️ OOP & SOLID", id="principles"):
+                gr.Markdown("""
+                ### Apply OOP and SOLID principles to test automation
+                
+                Learn how to create maintainable, scalable test frameworks using proven design principles.
+                """)
+                
+                principles_interface = create_principles_interface()
+            
+            # Architecture Analysis Tab
+            with gr.Tab("🔬 Architecture", id="architecture"):
+                gr.Markdown("""
+                ### Deep dive into Playwright's internal architecture
+                
+                Understand the client-server model, communication protocols, and design decisions that make Playwright powerful.
+                """)
+                
+                architecture_interface = create_architecture_interface()
+            
+            # AI Assistant Tab
+            with gr.Tab("🤖 AI Assistant", id="ai_chat"):
+                gr.Markdown("""
+                ### Get personalized help from our AI assistant
+                
+                Ask questions about Playwright, get code examples, and receive expert guidance.
+                """)
+                
+                ai_interface = create_ai_chat_interface()
+            
+            # Resources Tab
+            with gr.Tab("📚 Resources", id="resources"):
+                gr.Markdown(_RESOURCES_MD)
+        
+        # Footer
+        gr.Markdown(_FOOTER_MD, elem_classes="highlight-box")
     
     return app
 
@@ -239,6 +247,9 @@ def main():
     
     print("🎭 Starting Playwright Studies Portal...")
     
+    # Initialize database
+    initialize_database()
+    
     # Check for Hugging Face token
     if not os.getenv("HUGGINGFACE_TOKEN"):
         print("⚠️ HUGGINGFACE_TOKEN not found. AI features may be limited.")
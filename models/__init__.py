@@ -1,9 +1,9 @@
 from .database import (
-    Base, User, StudyModule, StudyProgress, Question, CodeExample,
-    engine, SessionLocal, create_tables, get_db
+    Base, User, StudyModule, StudyProgress, Question, CodeExample, SeedMarker,
+    engine, SessionLocal, ScopedSession, create_tables, get_db
 )
 
 __all__ = [
-    "Base", "User", "StudyModule", "StudyProgress", "Question", "CodeExample",
-    "engine", "SessionLocal", "create_tables", "get_db"
+    "Base", "User", "StudyModule", "StudyProgress", "Question", "CodeExample", "SeedMarker",
+    "engine", "SessionLocal", "ScopedSession", "create_tables", "get_db"
 ]
@@ -1,11 +1,10 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, ForeignKey
+import sqlalchemy
+from sqlalchemy import create_engine, event, inspect, Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
-from datetime import datetime
+from sqlalchemy.orm import scoped_session, sessionmaker, relationship
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql import func
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
 
 Base = declarative_base()
 
@@ -15,7 +14,7 @@ class User(Base):
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String(50), unique=True, index=True)
     email = Column(String(100), unique=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
     
     # Relationships
     progress = relationship("StudyProgress", back_populates="user")
@@ -23,21 +22,24 @@ class User(Base):
 
 class StudyModule(Base):
     __tablename__ = "study_modules"
+    __table_args__ = (Index("ix_module_cat_diff", "category", "difficulty_level"),)
     
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), nullable=False)
+    name = Column(String(100), nullable=False, unique=True, index=True)
     description = Column(Text)
     category = Column(String(50))  # cypress_migration, best_practices, oop, solid, frameworks
     content = Column(Text)
     difficulty_level = Column(String(20))  # beginner, intermediate, advanced
     estimated_time = Column(Integer)  # in minutes
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
     
     # Relationships
     progress = relationship("StudyProgress", back_populates="module")
 
 class StudyProgress(Base):
     __tablename__ = "study_progress"
+    # One progress row per (user, module); also serves lookups by user
+    __table_args__ = (Index("ix_progress_user_module", "user_id", "module_id", unique=True),)
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -45,7 +47,7 @@ class StudyProgress(Base):
     completed = Column(Boolean, default=False)
     progress_percentage = Column(Integer, default=0)
     time_spent = Column(Integer, default=0)  # in minutes
-    started_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, default=func.now(), server_default=func.now())
     completed_at = Column(DateTime, nullable=True)
     
     # Relationships
@@ -61,7 +63,7 @@ class Question(Base):
     answer_text = Column(Text)
     category = Column(String(50))
     difficulty = Column(String(20))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
     answered_at = Column(DateTime, nullable=True)
     
     # Relationships
@@ -69,6 +71,7 @@ class Question(Base):
 
 class CodeExample(Base):
     __tablename__ = "code_examples"
+    __table_args__ = (Index("ix_example_cat_diff", "category", "difficulty_level"),)
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
@@ -78,21 +81,88 @@ class CodeExample(Base):
     framework = Column(String(20))  # cypress, playwright
     code_before = Column(Text)  # Original Cypress code
     code_after = Column(Text)   # Converted Playwright code
+    code_hash = Column(String(16))  # blake2b of the seeded code, to detect edited seeds
     explanation = Column(Text)
     difficulty_level = Column(String(20))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+
+class SeedMarker(Base):
+    __tablename__ = "_seed_markers"
+    
+    name = Column(String(100), primary_key=True)  # e.g. code_examples_v1; bump to re-seed
+    seeded_at = Column(DateTime, default=func.now(), server_default=func.now())
 
 # Database setup
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./study_portal.db")
-engine = create_engine(DATABASE_URL)
+
+_SQLALCHEMY_MAJOR = int(sqlalchemy.__version__.split(".")[0])
+
+def _engine_options(url):
+    """Connection pool settings for the configured database URL"""
+    options = {"pool_pre_ping": True}
+    if _SQLALCHEMY_MAJOR >= 2:
+        # Cap batched multi-row INSERTs (insertmanyvalues is new in SQLAlchemy 2.0)
+        options["insertmanyvalues_page_size"] = 1000
+    if url.startswith("sqlite"):
+        # Gradio handlers run on worker threads
+        options["connect_args"] = {"check_same_thread": False}
+        if url in ("sqlite://", "sqlite:///:memory:"):
+            # A single shared connection keeps the in-memory database alive
+            options["poolclass"] = StaticPool
+            return options
+    options.update(pool_size=10, max_overflow=20, pool_recycle=1800)
+    return options
+
+engine = create_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL lets Gradio readers run alongside writes; NORMAL sync cuts fsyncs per commit"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Thread-local session registry so request handlers reuse one Session per thread
+ScopedSession = scoped_session(SessionLocal)
+
+_tables_created = False
 
 def create_tables():
-    Base.metadata.create_all(bind=engine)
+    global _tables_created
+    if _tables_created:
+        return
+    
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    missing_tables = [t for t in Base.metadata.sorted_tables if t.name not in existing_tables]
+    if missing_tables:
+        Base.metadata.create_all(bind=engine, tables=missing_tables, checkfirst=False)
+    
+    # Existing tables may predate columns and indexes declared since they were created
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing_columns and column.nullable:
+                column_type = column.type.compile(dialect=engine.dialect)
+                with engine.begin() as conn:
+                    conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                index.create(bind=engine)
+    
+    _tables_created = True
 
 def get_db():
-    db = SessionLocal()
+    db = ScopedSession()
     try:
         yield db
     finally:
-        db.close()
+        ScopedSession.remove()
@@ -1,4 +1,4 @@
-from .ai_service import ai_service, KimiAIService
+from .ai_service import get_ai_service, KimiAIService
 from .study_service import study_service, StudyService
 
-__all__ = ["ai_service", "KimiAIService", "study_service", "StudyService"]
+__all__ = ["get_ai_service", "KimiAIService", "study_service", "StudyService"]
@@ -1,12 +1,113 @@
 from transformers import AutoTokenizer, AutoModelForCausalLM
+from transformers import LogitsProcessorList, TemperatureLogitsWarper, TopKLogitsWarper, TopPLogitsWarper
 import torch
 import os
 from dotenv import load_dotenv
 from typing import Optional, List, Dict, Any
 import json
+import asyncio
+import threading
+
+try:
+    from transformers import StaticCache
+except ImportError:  # transformers < 4.38: decode through model.generate only
+    StaticCache = None
+
+try:
+    import torchao  # noqa: F401  (TorchAoConfig needs it at load time)
+    from transformers import TorchAoConfig
+except ImportError:  # optional, int4 weight quantization on CUDA
+    TorchAoConfig = None
 
 load_dotenv()
 
+# Educational prompt around the student's question; tokenized once when the model loads.
+# The space before the question is tokenized with it, as it would be in the full string
+_PROMPT_PREAMBLE = """You are an expert Playwright testing instructor. Help students learn Playwright by providing clear, accurate, and practical guidance.
+
+Student Question:"""
+
+_PROMPT_SUFFIX = """
+
+Please provide a helpful, educational response that includes:
+1. Clear explanation
+2. Code examples when relevant
+3. Best practices
+4. Common pitfalls to avoid
+
+Response:"""
+
+# Concurrent queries are coalesced into batches of up to this many, waiting at most this long
+_BATCH_MAX_SIZE = 8
+_BATCH_WAIT_SECONDS = 0.01
+
+# Static KV-cache lengths with a captured decode graph; max_length is rounded up to one of these
+_GRAPH_BUCKETS = (256, 512, 1024, 2048, 4096)
+
+class _CUDAGraphRunner:
+    """A single-token decode step captured as a CUDA graph over a fixed-size static KV cache"""
+    
+    def __init__(self, model, max_cache_len: int, device: torch.device, forward=None):
+        self.model = model
+        # Optionally a torch.compile'd model.forward; the graph is captured over its kernels
+        self.forward = forward or model.forward
+        self.max_cache_len = max_cache_len
+        self.cache = StaticCache(
+            config=model.config,
+            max_batch_size=1,
+            max_cache_len=max_cache_len,
+            device=device,
+            dtype=model.dtype
+        )
+        # Persistent inputs: only the sampled token and its position change between replays
+        self.input_ids = torch.zeros((1, 1), dtype=torch.long, device=device)
+        self.cache_position = torch.zeros((1,), dtype=torch.long, device=device)
+        self.graph = None
+        self.logits = None
+    
+    def _forward(self):
+        return self.forward(
+            input_ids=self.input_ids,
+            position_ids=self.cache_position.unsqueeze(0),
+            cache_position=self.cache_position,
+            past_key_values=self.cache,
+            use_cache=True
+        ).logits
+    
+    def capture(self):
+        """Warm up on a side stream, then record one decode step into the graph"""
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for _ in range(2):
+                self._forward()
+        torch.cuda.current_stream().wait_stream(stream)
+        
+        self.graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(self.graph):
+            self.logits = self._forward()
+        self.cache.reset()
+    
+    def prefill(self, input_ids: torch.Tensor) -> torch.Tensor:
+        """Run the prompt through the model eagerly and return the last-position logits"""
+        self.cache.reset()
+        positions = torch.arange(input_ids.shape[1], device=input_ids.device)
+        logits = self.model(
+            input_ids=input_ids,
+            position_ids=positions.unsqueeze(0),
+            cache_position=positions,
+            past_key_values=self.cache,
+            use_cache=True
+        ).logits
+        return logits[:, -1]
+    
+    def step(self, token: torch.Tensor, position: int) -> torch.Tensor:
+        """Feed one token at ``position`` by replaying the captured graph"""
+        self.input_ids.copy_(token)
+        self.cache_position.fill_(position)
+        self.graph.replay()
+        return self.logits[:, -1]
+
 class KimiAIService:
     """AI service using Kimi-K2-Instruct model for Playwright education assistance"""
     
@@ -15,7 +116,19 @@ class KimiAIService:
         self.tokenizer = None
         self.model = None
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        self._initialize_model()
+        # Captured decode graphs keyed by static cache length; replays share buffers, so one at a time
+        self._graph_runners: Dict[int, _CUDAGraphRunner] = {}
+        self._use_cuda_graphs = self.device.type == "cuda" and StaticCache is not None
+        self._graph_lock = threading.Lock()
+        self._compiled_forward = None
+        self._preamble_ids: Optional[torch.Tensor] = None
+        self._suffix_ids: Optional[torch.Tensor] = None
+        # Every id that ends generation, as model.generate would stop on it
+        self._stop_token_ids: set = set()
+        # Request queue for micro-batching, bound to the event loop that first awaits generate_response
+        self._queue: Optional[asyncio.Queue] = None
+        self._queue_loop = None
+        self._batch_worker_task = None
     
     def _initialize_model(self):
         """Initialize the Kimi-K2-Instruct model"""
@@ -27,17 +140,50 @@ class KimiAIService:
                 trust_remote_code=True
             )
             
-            self.model = AutoModelForCausalLM.from_pretrained(
-                self.model_name,
-                token=os.getenv("HUGGINGFACE_TOKEN"),
-                trust_remote_code=True,
-                torch_dtype=torch.float16 if torch.cuda.is_available() else torch.float32,
-                device_map="auto" if torch.cuda.is_available() else None
-            )
+            # TF32 for any matmuls still done in fp32
+            torch.set_float32_matmul_precision("high")
+            
+            model_kwargs = {
+                "torch_dtype": self._select_dtype(),
+                "device_map": "auto" if torch.cuda.is_available() else None
+            }
+            if (TorchAoConfig is not None and torch.cuda.is_available()
+                    and torch.cuda.get_device_capability()[0] >= 8):
+                # int4 weight-only: decode reads ~4x fewer weight bytes; its kernels need sm80+ and bf16
+                model_kwargs["quantization_config"] = TorchAoConfig("int4_weight_only", group_size=128)
+                model_kwargs["torch_dtype"] = torch.bfloat16
+            
+            self.model = self._load_model(**model_kwargs)
             
             if not torch.cuda.is_available():
                 self.model = self.model.to(self.device)
+            
+            # Batched prompts are left-padded so every row ends where generation starts
+            self.tokenizer.padding_side = "left"
+            if self.tokenizer.pad_token_id is None:
+                self.tokenizer.pad_token = self.tokenizer.eos_token
+            
+            # The fixed parts of the prompt; only the question is tokenized per request
+            self._preamble_ids = self.tokenizer.encode(
+                _PROMPT_PREAMBLE, return_tensors="pt", add_special_tokens=True
+            ).to(self.device)
+            self._suffix_ids = self.tokenizer.encode(
+                _PROMPT_SUFFIX, return_tensors="pt", add_special_tokens=False
+            ).to(self.device)
+            
+            # generation_config.eos_token_id may be a list (e.g. a separate end-of-turn id)
+            eos_token_id = self.model.generation_config.eos_token_id
+            if isinstance(eos_token_id, int):
+                eos_token_id = [eos_token_id]
+            self._stop_token_ids = set(eos_token_id or [])
+            if self.tokenizer.eos_token_id is not None:
+                self._stop_token_ids.add(self.tokenizer.eos_token_id)
                 
+            if self._use_cuda_graphs and hasattr(torch, "compile"):
+                # Compile without cudagraphs ("reduce-overhead"): the runner captures its own graph.
+                # dynamic=False keeps one specialization per static cache length instead of symbolic shapes
+                self._compiled_forward = torch.compile(self.model.forward, fullgraph=True, dynamic=False)
+            
             print("Model loaded successfully!")
             
         except Exception as e:
@@ -46,54 +192,225 @@ class KimiAIService:
             self.model = None
             self.tokenizer = None
     
-    def generate_response(self, prompt: str, max_length: int = 512, temperature: float = 0.7) -> str:
-        """Generate AI response for educational queries"""
+    def _select_dtype(self) -> torch.dtype:
+        """bf16 on Ampere+ GPUs and bf16-capable CPUs; otherwise fp16 on GPU, fp32 on CPU"""
+        if torch.cuda.is_available():
+            major, _ = torch.cuda.get_device_capability()
+            return torch.bfloat16 if major >= 8 else torch.float16
+        try:
+            # AVX-512 BF16 / AMX (x86) or equivalent native bf16 support in oneDNN
+            cpu_bf16 = torch.ops.mkldnn._is_mkldnn_bf16_supported()
+        except (AttributeError, RuntimeError):
+            cpu_bf16 = False
+        return torch.bfloat16 if cpu_bf16 else torch.float32
+    
+    def _load_model(self, **kwargs):
+        """Load the model with the fastest attention kernel available"""
+        # FlashAttention-2 needs the flash-attn package, fp16/bf16 and an Ampere+ GPU
+        implementations = ["flash_attention_2", "sdpa"] if torch.cuda.is_available() else ["sdpa"]
+        for attn_implementation in implementations:
+            try:
+                return AutoModelForCausalLM.from_pretrained(
+                    self.model_name,
+                    token=os.getenv("HUGGINGFACE_TOKEN"),
+                    trust_remote_code=True,
+                    attn_implementation=attn_implementation,
+                    **kwargs
+                )
+            except (ImportError, ValueError) as e:
+                print(f"{attn_implementation} attention unavailable: {e}")
+        
+        # Model code that supports neither: keep its default (eager) attention
+        return AutoModelForCausalLM.from_pretrained(
+            self.model_name,
+            token=os.getenv("HUGGINGFACE_TOKEN"),
+            trust_remote_code=True,
+            **kwargs
+        )
+    
+    async def generate_response(self, prompt: str, max_length: int = 512, temperature: float = 0.7) -> str:
+        """Generate AI response for educational queries, batched with concurrent requests"""
         if self.model is None or self.tokenizer is None:
             return self._fallback_response(prompt)
         
-        try:
-            # Format prompt for educational context
-            formatted_prompt = self._format_educational_prompt(prompt)
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._queue_loop is not loop:
+            self._queue = asyncio.Queue()
+            self._queue_loop = loop
+            self._batch_worker_task = loop.create_task(self._batch_worker(self._queue))
+        
+        future = loop.create_future()
+        await self._queue.put((prompt, max_length, temperature, future))
+        return await future
+    
+    async def _batch_worker(self, queue: asyncio.Queue):
+        """Collect queued prompts into batches and generate each batch in a worker thread"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + _BATCH_WAIT_SECONDS
+            while len(batch) < _BATCH_MAX_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
             
-            # Tokenize input
-            inputs = self.tokenizer.encode(formatted_prompt, return_tensors="pt").to(self.device)
+            # Rows of one generate() call share their generation settings
+            groups: Dict[tuple, List[tuple]] = {}
+            for prompt, max_length, temperature, future in batch:
+                groups.setdefault((max_length, temperature), []).append((prompt, future))
             
-            # Generate response
-            with torch.no_grad():
+            for (max_length, temperature), items in groups.items():
+                prompts = [prompt for prompt, _ in items]
+                responses = await loop.run_in_executor(
+                    None, self._generate_batch, prompts, max_length, temperature
+                )
+                for (_, future), response in zip(items, responses):
+                    if not future.done():
+                        future.set_result(response)
+    
+    def _generate_batch(self, prompts: List[str], max_length: int, temperature: float) -> List[str]:
+        """Generate responses for several prompts with one left-padded generate() call"""
+        if len(prompts) == 1:
+            return [self._generate_single(prompts[0], max_length, temperature)]
+        
+        try:
+            formatted_prompts = [self._format_educational_prompt(prompt) for prompt in prompts]
+            inputs = self.tokenizer(formatted_prompts, return_tensors="pt", padding=True).to(self.device)
+            
+            with torch.inference_mode():
                 outputs = self.model.generate(
-                    inputs,
+                    **inputs,
                     max_length=max_length,
                     temperature=temperature,
                     do_sample=True,
-                    pad_token_id=self.tokenizer.eos_token_id,
+                    pad_token_id=self.tokenizer.pad_token_id,
                     num_return_sequences=1
                 )
             
-            # Decode response
-            response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
+            prompt_length = inputs["input_ids"].shape[1]
+            return [
+                self.tokenizer.decode(row[prompt_length:], skip_special_tokens=True).strip()
+                for row in outputs
+            ]
             
-            # Extract only the generated part
-            response = response[len(formatted_prompt):].strip()
+        except Exception as e:
+            print(f"Error generating batched response: {e}")
+            return [self._fallback_response(prompt) for prompt in prompts]
+    
+    def _generate_single(self, prompt: str, max_length: int, temperature: float) -> str:
+        """Generate one response, replaying the captured decode graph when available"""
+        try:
+            # Tokenize the question and wrap it in the pre-tokenized educational prompt
+            query_ids = self.tokenizer.encode(f" {prompt}", return_tensors="pt", add_special_tokens=False).to(self.device)
+            inputs = torch.cat([self._preamble_ids, query_ids, self._suffix_ids], dim=1)
             
-            return response
+            # Generate response
+            with torch.inference_mode():
+                runner = self._get_graph_runner(max_length)
+                if runner is not None:
+                    with self._graph_lock:
+                        generated = self._decode_with_graph(runner, inputs, max_length, temperature)
+                else:
+                    outputs = self.model.generate(
+                        inputs,
+                        max_length=max_length,
+                        temperature=temperature,
+                        do_sample=True,
+                        pad_token_id=self.tokenizer.eos_token_id,
+                        num_return_sequences=1
+                    )
+                    # Extract only the generated part
+                    generated = outputs[0][inputs.shape[1]:]
+            
+            # Decode response
+            response = self.tokenizer.decode(generated, skip_special_tokens=True)
+            
+            return response.strip()
             
         except Exception as e:
             print(f"Error generating response: {e}")
             return self._fallback_response(prompt)
     
+    def _get_graph_runner(self, max_length: int) -> Optional[_CUDAGraphRunner]:
+        """Return the captured decode graph for max_length's bucket, capturing it on first use"""
+        if not self._use_cuda_graphs:
+            return None
+        
+        bucket = next((size for size in _GRAPH_BUCKETS if size >= max_length), None)
+        if bucket is None:
+            return None
+        
+        with self._graph_lock:
+            runner = self._graph_runners.get(bucket)
+            if runner is None:
+                try:
+                    runner = self._capture_runner(bucket)
+                except Exception as e:
+                    # Model code that can't run with a static cache or be captured: stay on generate()
+                    print(f"CUDA graph capture unavailable, using model.generate: {e}")
+                    self._use_cuda_graphs = False
+                    return None
+                self._graph_runners[bucket] = runner
+        return runner
+    
+    def _capture_runner(self, max_cache_len: int) -> _CUDAGraphRunner:
+        """Capture a decode graph over the compiled forward, or the eager one if compiling fails"""
+        if self._compiled_forward is not None:
+            try:
+                runner = _CUDAGraphRunner(self.model, max_cache_len, self.device, self._compiled_forward)
+                runner.capture()
+                return runner
+            except Exception as e:
+                print(f"torch.compile of the decode step failed, capturing the eager forward: {e}")
+                self._compiled_forward = None
+        
+        runner = _CUDAGraphRunner(self.model, max_cache_len, self.device)
+        runner.capture()
+        return runner
+    
+    def _decode_with_graph(self, runner: _CUDAGraphRunner, inputs: torch.Tensor,
+                           max_length: int, temperature: float) -> List[int]:
+        """Prefill the prompt once, then replay the captured graph for each new token"""
+        generated = []
+        warpers = self._sampling_warpers(temperature)
+        logits = runner.prefill(inputs)
+        for position in range(inputs.shape[1], max_length):
+            next_token = self._sample(logits, warpers)
+            token_id = next_token.item()
+            if token_id in self._stop_token_ids:
+                break
+            generated.append(token_id)
+            if position + 1 < max_length:
+                logits = runner.step(next_token, position)
+        return generated
+    
+    def _sampling_warpers(self, temperature: float) -> LogitsProcessorList:
+        """The temperature, top-k and top-p warpers model.generate applies, from the model's generation_config"""
+        config = self.model.generation_config
+        warpers = LogitsProcessorList()
+        if temperature != 1.0:
+            warpers.append(TemperatureLogitsWarper(temperature))
+        if config.top_k:
+            warpers.append(TopKLogitsWarper(top_k=config.top_k))
+        if config.top_p is not None and config.top_p < 1.0:
+            warpers.append(TopPLogitsWarper(top_p=config.top_p))
+        return warpers
+    
+    @staticmethod
+    def _sample(logits: torch.Tensor, warpers: LogitsProcessorList) -> torch.Tensor:
+        """Sample the next token id, shape (1, 1), from last-position logits"""
+        # The warpers only look at the scores, so no input_ids are needed
+        scores = warpers(None, logits.float())
+        probs = torch.softmax(scores, dim=-1)
+        return torch.multinomial(probs, num_samples=1)
+    
     def _format_educational_prompt(self, user_query: str) -> str:
         """Format the prompt for educational context"""
-        return f"""You are an expert Playwright testing instructor. Help students learn Playwright by providing clear, accurate, and practical guidance.
-
-Student Question: {user_query}
-
-Please provide a helpful, educational response that includes:
-1. Clear explanation
-2. Code examples when relevant
-3. Best practices
-4. Common pitfalls to avoid
-
-Response:"""
+        return f"{_PROMPT_PREAMBLE} {user_query}{_PROMPT_SUFFIX}"
     
     def _fallback_response(self, prompt: str) -> str:
         """Fallback response when model is unavailable"""
@@ -112,5 +429,17 @@ Response:"""
         
         return "I'm here to help you learn Playwright! Please ask about Cypress migration, best practices, OOP principles, SOLID principles, or framework design."
 
-# Singleton instance
-ai_service = KimiAIService()
+# Singleton instance, created (and the model loaded) on first use rather than at import
+_instance: Optional[KimiAIService] = None
+_instance_lock = threading.Lock()
+
+def get_ai_service() -> KimiAIService:
+    """Get the shared AI service, loading the model on the first call"""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                service = KimiAIService()
+                service._initialize_model()
+                _instance = service
+    return _instance
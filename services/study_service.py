@@ -1,83 +1,136 @@
-from sqlalchemy.orm import Session
-from models import User, StudyModule, StudyProgress, Question, CodeExample, get_db
-from typing import List, Optional, Dict, Any
+from contextlib import contextmanager
+from sqlalchemy import func, or_, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, selectinload
+from models import User, StudyModule, StudyProgress, Question, CodeExample, SessionLocal
+from typing import Iterator, List, Optional, Dict, Any
 from datetime import datetime
 
+# Dialects whose INSERT supports ON CONFLICT ... DO UPDATE
+_UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
 class StudyService:
     """Service for managing study progress and content"""
     
     def __init__(self):
-        pass
+        # Sessions are reused only when the caller passes one (e.g. from get_db()) to several calls.
+        # Without one, each call opens its own short-lived session; it never touches the thread's
+        # ScopedSession, so closing it can't close a session the caller holds
+        self._session_factory = SessionLocal
+    
+    @contextmanager
+    def _session(self, db: Optional[Session]) -> Iterator[Session]:
+        """Use the caller's session, or a fresh session closed afterwards"""
+        if db is not None:
+            yield db
+            return
+        with self._session_factory() as session:
+            yield session
     
-    def create_user(self, username: str, email: str) -> User:
+    def create_user(self, username: str, email: str, db: Optional[Session] = None) -> User:
         """Create a new user"""
-        db = next(get_db())
-        try:
+        with self._session(db) as db:
             user = User(username=username, email=email)
             db.add(user)
             db.commit()
             db.refresh(user)
             return user
-        finally:
-            db.close()
     
-    def get_user(self, username: str) -> Optional[User]:
-        """Get user by username"""
-        db = next(get_db())
-        try:
-            return db.query(User).filter(User.username == username).first()
-        finally:
-            db.close()
+    def get_user(self, username: str, db: Optional[Session] = None) -> Optional[User]:
+        """Get user by username (with their progress loaded)"""
+        with self._session(db) as db:
+            query = select(User).options(selectinload(User.progress)).where(User.username == username)
+            return db.execute(query).scalars().first()
     
-    def get_study_modules(self, category: Optional[str] = None) -> List[StudyModule]:
+    def get_study_modules(self, category: Optional[str] = None, db: Optional[Session] = None) -> List[StudyModule]:
         """Get all study modules, optionally filtered by category"""
-        db = next(get_db())
-        try:
-            query = db.query(StudyModule)
+        with self._session(db) as db:
+            query = select(StudyModule)
             if category:
-                query = query.filter(StudyModule.category == category)
-            return query.all()
-        finally:
-            db.close()
+                query = query.where(StudyModule.category == category)
+            return list(db.execute(query).scalars())
     
-    def get_user_progress(self, user_id: int) -> List[StudyProgress]:
-        """Get user's study progress"""
-        db = next(get_db())
-        try:
-            return db.query(StudyProgress).filter(StudyProgress.user_id == user_id).all()
-        finally:
-            db.close()
+    def get_user_progress(self, user_id: int, db: Optional[Session] = None) -> List[StudyProgress]:
+        """Get user's study progress (with each module loaded)"""
+        with self._session(db) as db:
+            query = (
+                select(StudyProgress)
+                .options(selectinload(StudyProgress.module))
+                .where(StudyProgress.user_id == user_id)
+            )
+            return list(db.execute(query).scalars())
     
-    def update_progress(self, user_id: int, module_id: int, progress_percentage: int, time_spent: int = 0) -> StudyProgress:
-        """Update user's progress on a module"""
-        db = next(get_db())
-        try:
-            progress = db.query(StudyProgress).filter(
-                StudyProgress.user_id == user_id,
-                StudyProgress.module_id == module_id
-            ).first()
-            
-            if not progress:
-                progress = StudyProgress(user_id=user_id, module_id=module_id)
-                db.add(progress)
-            
-            progress.progress_percentage = progress_percentage
-            progress.time_spent += time_spent
+    def update_progress(self, user_id: int, module_id: int, progress_percentage: int, time_spent: int = 0,
+                        db: Optional[Session] = None) -> StudyProgress:
+        """Update user's progress on a module with a single upsert"""
+        with self._session(db) as db:
+            dialect = db.get_bind().dialect.name
+            completed = progress_percentage >= 100
+            values = {
+                "user_id": user_id,
+                "module_id": module_id,
+                "progress_percentage": progress_percentage,
+                "time_spent": time_spent,
+                "completed": completed,
+                "completed_at": datetime.utcnow() if completed else None
+            }
             
-            if progress_percentage >= 100:
-                progress.completed = True
-                progress.completed_at = datetime.utcnow()
+            # Conflicts on the (user_id, module_id) unique index; completion is never reset
+            if dialect in _UPSERT_INSERTS:
+                stmt = _UPSERT_INSERTS[dialect](StudyProgress).values(**values)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["user_id", "module_id"],
+                    set_={
+                        "progress_percentage": stmt.excluded.progress_percentage,
+                        "time_spent": StudyProgress.time_spent + stmt.excluded.time_spent,
+                        "completed": or_(StudyProgress.completed, stmt.excluded.completed),
+                        "completed_at": func.coalesce(stmt.excluded.completed_at, StudyProgress.completed_at)
+                    }
+                ).returning(StudyProgress)
+                progress = db.execute(stmt, execution_options={"populate_existing": True}).scalar_one()
+            elif dialect in ("mysql", "mariadb"):
+                # No RETURNING on MySQL: upsert, then read the row back
+                stmt = mysql_insert(StudyProgress).values(**values)
+                stmt = stmt.on_duplicate_key_update(
+                    progress_percentage=stmt.inserted.progress_percentage,
+                    time_spent=StudyProgress.time_spent + stmt.inserted.time_spent,
+                    completed=or_(StudyProgress.completed, stmt.inserted.completed),
+                    completed_at=func.coalesce(stmt.inserted.completed_at, StudyProgress.completed_at)
+                )
+                db.execute(stmt)
+                progress = db.execute(
+                    select(StudyProgress).where(
+                        StudyProgress.user_id == user_id,
+                        StudyProgress.module_id == module_id
+                    )
+                ).scalar_one()
+            else:
+                # Other dialects: read-modify-write
+                progress = db.execute(
+                    select(StudyProgress).where(
+                        StudyProgress.user_id == user_id,
+                        StudyProgress.module_id == module_id
+                    )
+                ).scalars().first()
+                if not progress:
+                    progress = StudyProgress(user_id=user_id, module_id=module_id, time_spent=0)
+                    db.add(progress)
+                progress.progress_percentage = progress_percentage
+                progress.time_spent += time_spent
+                if completed:
+                    progress.completed = True
+                    progress.completed_at = values["completed_at"]
             
             db.commit()
             db.refresh(progress)
             return progress
-        finally:
-            db.close()
     
-    def save_question(self, user_id: int, question: str, answer: str, category: str) -> Question:
+    def save_question(self, user_id: int, question: str, answer: str, category: str,
+                      db: Optional[Session] = None) -> Question:
         """Save a user question and AI answer"""
-        db = next(get_db())
-        try:
+        with self._session(db) as db:
             question_obj = Question(
                 user_id=user_id,
                 question_text=question,
@@ -89,21 +142,17 @@ class StudyService:
             db.commit()
             db.refresh(question_obj)
             return question_obj
-        finally:
-            db.close()
     
-    def get_code_examples(self, category: Optional[str] = None, framework: Optional[str] = None) -> List[CodeExample]:
+    def get_code_examples(self, category: Optional[str] = None, framework: Optional[str] = None,
+                          db: Optional[Session] = None) -> List[CodeExample]:
         """Get code examples filtered by category and/or framework"""
-        db = next(get_db())
-        try:
-            query = db.query(CodeExample)
+        with self._session(db) as db:
+            query = select(CodeExample)
             if category:
-                query = query.filter(CodeExample.category == category)
+                query = query.where(CodeExample.category == category)
             if framework:
-                query = query.filter(CodeExample.framework == framework)
-            return query.all()
-        finally:
-            db.close()
+                query = query.where(CodeExample.framework == framework)
+            return list(db.execute(query).scalars())
 
 # Singleton instance
 study_service = StudyService()
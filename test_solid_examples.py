@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+"""
+Test that SOLID example code is always resolved from data/solid_examples/ and never leaks file sentinels
+"""
+
+from data import solid_principles
+from data.solid_principles import _FILE_SENTINEL, get_solid_guide
+
+PRINCIPLES = {
+    "SINGLE_RESPONSIBILITY": solid_principles.SINGLE_RESPONSIBILITY,
+    "OPEN_CLOSED": solid_principles.OPEN_CLOSED,
+    "LISKOV_SUBSTITUTION": solid_principles.LISKOV_SUBSTITUTION,
+    "INTERFACE_SEGREGATION": solid_principles.INTERFACE_SEGREGATION,
+    "DEPENDENCY_INVERSION": solid_principles.DEPENDENCY_INVERSION,
+}
+
+def _find_sentinels(value, path):
+    """Yield the path of every string reachable from value that still starts with the file sentinel"""
+    if isinstance(value, str):
+        if value.startswith(_FILE_SENTINEL):
+            yield path
+    elif hasattr(value, "keys"):
+        for key in value.keys():
+            yield from _find_sentinels(value[key], f"{path}[{key!r}]")
+    elif isinstance(value, (list, tuple)):
+        for i, item in enumerate(value):
+            yield from _find_sentinels(item, f"{path}[{i}]")
+
+def test_no_sentinels_reachable():
+    """Every public way of reading a principle returns the example code"""
+
+    views = {"get_solid_guide()": get_solid_guide()}
+    for name, principle in PRINCIPLES.items():
+        views[name] = principle
+        views[f"{name}.copy()"] = principle.copy()
+        views[f"dict({name})"] = dict(principle)
+        views[f"{name} | {{}}"] = principle | {}
+        views[f"{{}} | {name}"] = {} | principle
+        views[f"{name}.items()"] = dict(principle.items())
+        views[f"{name}.values()"] = list(principle.values())
+
+    print("🧪 Checking SOLID principle mappings for unresolved example files...")
+    print("=" * 70)
+
+    failures = []
+    for label, view in views.items():
+        leaks = list(_find_sentinels(view, label))
+        if leaks:
+            for leak in leaks:
+                print(f"  ❌ Unresolved: {leak}")
+            failures.extend(leaks)
+        else:
+            print(f"  ✅ {label}")
+
+    assert not failures, f"{len(failures)} value(s) still reference example files"
+    print("\n✅ All SOLID examples resolved!")
+
+if __name__ == "__main__":
+    test_no_sentinels_reachable()
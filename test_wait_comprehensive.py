@@ -7,58 +7,53 @@ Comprehensive test for cy.wait() conversion patterns using the actual conversion
 import re
 from typing import Tuple, List
 
+# Same as components/interfaces.py - keep in sync.
+# All wait patterns fused into one alternation, most specific first so earlier branches win
+_WAIT_PATTERNS = re.compile(
+    r"(?P<wait_its_should>cy\.wait\('@(?P<should_alias>[^'\"]+)'\)\.its\('response\.statusCode'\)"
+    r"\.should\('eq',\s*(?P<status_code>\d+)\))"
+    r"|(?P<wait_its>cy\.wait\('@(?P<its_alias>[^'\"]+)'\)\.its\('response\.statusCode'\))"
+    r"|(?P<wait_alias>cy\.wait\('@(?P<alias>[^'\"]+)'\))"
+    r"|(?P<wait_number>cy\.wait\((?P<ms>\d+)\))"
+    r"|(?P<wait_until>cy\.waitUntil\(\(\) => (?P<condition>[^)]+)\))"
+)
+
+def _alias_wait(alias: str) -> str:
+    """Convert cy.wait('@alias') to an appropriate Playwright wait based on common alias names"""
+    if 'api' in alias.lower() or 'request' in alias.lower() or 'get' in alias.lower():
+        return f"await page.waitForResponse('**/*{alias.replace('get', '').replace('api', '').replace('data', '').lower()}*')"
+    return f"await page.waitForResponse('**/{alias}**')"
+
+def _convert_wait(match: re.Match) -> Tuple[str, str]:
+    """Playwright replacement (and explanation note) for one _WAIT_PATTERNS match"""
+    kind = match.lastgroup
+    if kind == "wait_its_should":
+        # cy.wait('@alias').its('response.statusCode').should('eq', number)
+        return (f"expect((await page.waitForResponse('**/{match['should_alias']}**')).status())"
+                f".toBe({match['status_code']})"), ""
+    if kind == "wait_its":
+        # cy.wait('@alias').its('response.statusCode')
+        return f"(await page.waitForResponse('**/{match['its_alias']}**')).status()", ""
+    if kind == "wait_alias":
+        # cy.wait('@alias') - complex network waiting
+        return _alias_wait(match['alias']), ""
+    if kind == "wait_number":
+        # cy.wait(number) - fixed waits
+        return f"await page.waitForTimeout({match['ms']})", " (consider using auto-wait instead)"
+    # cy.waitUntil (if using cypress-wait-until plugin)
+    return f"await page.waitForFunction(() => {match['condition']})", ""
+
 def _convert_advanced_patterns(code: str) -> Tuple[str, List[str]]:
     """Convert Cypress wait patterns and advanced patterns to Playwright equivalents"""
     explanations = []
     
-    # Handle cy.wait('@alias').its('response.statusCode').should('eq', number) patterns first (most specific)
-    wait_its_should_pattern = r"cy\.wait\('@([^'\"]+)'\)\.its\('response\.statusCode'\)\.should\('eq',\s*(\d+)\)"
-    matches = re.findall(wait_its_should_pattern, code)
-    for alias, status_code in matches:
-        old_pattern = f"cy.wait('@{alias}').its('response.statusCode').should('eq', {status_code})"
-        new_pattern = f"expect((await page.waitForResponse('**/{alias}**')).status()).toBe({status_code})"
-        code = code.replace(old_pattern, new_pattern)
-        explanations.append(f"• {old_pattern} → {new_pattern}")
-    
-    # Handle cy.wait('@alias').its('response.statusCode') patterns
-    wait_its_pattern = r"cy\.wait\('@([^'\"]+)'\)\.its\('response\.statusCode'\)"
-    matches = re.findall(wait_its_pattern, code)
-    for match in matches:
-        old_pattern = f"cy.wait('@{match}').its('response.statusCode')"
-        new_pattern = f"(await page.waitForResponse('**/{match}**')).status()"
-        code = code.replace(old_pattern, new_pattern)
-        explanations.append(f"• {old_pattern} → {new_pattern}")
-    
-    # Handle cy.wait('@alias') patterns - complex network waiting (after .its patterns)
-    wait_alias_pattern = r"cy\.wait\('@([^'\"]+)'\)"
-    matches = re.findall(wait_alias_pattern, code)
-    for match in matches:
-        old_pattern = f"cy.wait('@{match}')"
-        # Convert to appropriate Playwright wait based on common patterns
-        if 'api' in match.lower() or 'request' in match.lower() or 'get' in match.lower():
-            new_pattern = f"await page.waitForResponse('**/*{match.replace('get', '').replace('api', '').replace('data', '').lower()}*')"
-        else:
-            new_pattern = f"await page.waitForResponse('**/{match}**')"
-        code = code.replace(old_pattern, new_pattern)
-        explanations.append(f"• {old_pattern} → {new_pattern}")
-    
-    # Handle cy.wait(number) patterns - fixed waits
-    wait_number_pattern = r"cy\.wait\((\d+)\)"
-    matches = re.findall(wait_number_pattern, code)
-    for match in matches:
-        old_pattern = f"cy.wait({match})"
-        new_pattern = f"await page.waitForTimeout({match})"
-        code = code.replace(old_pattern, new_pattern)
-        explanations.append(f"• {old_pattern} → {new_pattern} (consider using auto-wait instead)")
+    # Handle every cy.wait()/cy.waitUntil() pattern in one pass (see _WAIT_PATTERNS for precedence)
+    def dispatch_wait(match):
+        new_pattern, note = _convert_wait(match)
+        explanations.append(f"• {match.group(0)} → {new_pattern}{note}")
+        return new_pattern
     
-    # Handle cy.waitUntil patterns (if using cypress-wait-until plugin)
-    wait_until_pattern = r"cy\.waitUntil\(\(\) => ([^)]+)\)"
-    matches = re.findall(wait_until_pattern, code)
-    for match in matches:
-        old_pattern = f"cy.waitUntil(() => {match})"
-        new_pattern = f"await page.waitForFunction(() => {match})"
-        code = code.replace(old_pattern, new_pattern)
-        explanations.append(f"• {old_pattern} → {new_pattern}")
+    code = _WAIT_PATTERNS.sub(dispatch_wait, code)
     
     return code, explanations
 
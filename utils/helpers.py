@@ -1,60 +1,74 @@
+import difflib
+import re
+from collections import Counter
+
 def format_code_block(code: str, language: str = "javascript") -> str:
     """Format code with proper syntax highlighting"""
     return f"```{language}\n{code}\n```"
 
 def create_comparison_table(cypress_examples: list, playwright_examples: list) -> str:
     """Create a comparison table between Cypress and Playwright"""
-    table = "| Cypress | Playwright |\n|---------|------------|\n"
-    
-    for cypress, playwright in zip(cypress_examples, playwright_examples):
-        table += f"| `{cypress}` | `{playwright}` |\n"
+    rows = ["| Cypress | Playwright |", "|---------|------------|"]
+    rows.extend(f"| `{cypress}` | `{playwright}` |" for cypress, playwright in zip(cypress_examples, playwright_examples))
     
-    return table
+    return "\n".join(rows) + "\n"
+
+# Bracket characters validate_javascript_syntax balances
+_BRACKETS = re.compile(r"[(){}\[\]]")
 
 def validate_javascript_syntax(code: str) -> tuple[bool, str]:
     """Basic JavaScript syntax validation"""
     try:
-        # Basic checks for common syntax issues
-        if code.count('(') != code.count(')'):
+        # Basic checks for common syntax issues, counting every bracket in one scan
+        brackets = Counter(_BRACKETS.findall(code))
+        if brackets['('] != brackets[')']:
             return False, "Mismatched parentheses"
-        if code.count('{') != code.count('}'):
+        if brackets['{'] != brackets['}']:
             return False, "Mismatched curly braces"
-        if code.count('[') != code.count(']'):
+        if brackets['['] != brackets[']']:
             return False, "Mismatched square brackets"
         
         return True, "Syntax appears valid"
     except Exception as e:
         return False, f"Validation error: {str(e)}"
 
+# Every token extract_test_patterns counts, matched in a single scan. page/cy only look ahead
+# for their dot so a following .should( is still matched (and counted) on its own
+_TEST_PATTERN_TOKENS = re.compile(r"describe\(|\bit\(|\btest\(|expect\(|\.should\(|\basync\b|\bawait\b|\bpage(?=\.)|\bcy(?=\.)")
+
 def extract_test_patterns(code: str) -> dict:
     """Extract common test patterns from code"""
+    counts = Counter(_TEST_PATTERN_TOKENS.findall(code))
     patterns = {
-        "describe_blocks": code.count("describe("),
-        "test_cases": code.count("it(") + code.count("test("),
-        "assertions": code.count("expect(") + code.count(".should("),
-        "async_functions": code.count("async "),
-        "await_calls": code.count("await "),
-        "page_interactions": code.count("page.") + code.count("cy.")
+        "describe_blocks": counts["describe("],
+        "test_cases": counts["it("] + counts["test("],
+        "assertions": counts["expect("] + counts[".should("],
+        "async_functions": counts["async"],
+        "await_calls": counts["await"],
+        "page_interactions": counts["page"] + counts["cy"]
     }
     
     return patterns
 
 def generate_test_summary(patterns: dict) -> str:
     """Generate a summary of test patterns found"""
-    summary = "**Test Analysis:**\n\n"
+    lines = ["**Test Analysis:**", ""]
     
     if patterns["describe_blocks"] > 0:
-        summary += f"• {patterns['describe_blocks']} test suite(s)\n"
+        lines.append(f"• {patterns['describe_blocks']} test suite(s)")
     if patterns["test_cases"] > 0:
-        summary += f"• {patterns['test_cases']} test case(s)\n"
+        lines.append(f"• {patterns['test_cases']} test case(s)")
     if patterns["assertions"] > 0:
-        summary += f"• {patterns['assertions']} assertion(s)\n"
+        lines.append(f"• {patterns['assertions']} assertion(s)")
     if patterns["async_functions"] > 0:
-        summary += f"• {patterns['async_functions']} async function(s)\n"
+        lines.append(f"• {patterns['async_functions']} async function(s)")
     if patterns["page_interactions"] > 0:
-        summary += f"• {patterns['page_interactions']} page interaction(s)\n"
+        lines.append(f"• {patterns['page_interactions']} page interaction(s)")
     
-    return summary
+    return "\n".join(lines) + "\n"
+
+# The 11 possible progress bars (0-10 filled cells), built once
+_BARS = tuple("█" * filled + "░" * (10 - filled) for filled in range(11))
 
 def create_learning_progress_bar(completed: int, total: int) -> str:
     """Create a text-based progress bar"""
@@ -62,21 +76,16 @@ def create_learning_progress_bar(completed: int, total: int) -> str:
         return "No progress data available"
     
     percentage = (completed / total) * 100
-    filled = int(percentage / 10)
-    bar = "█" * filled + "░" * (10 - filled)
+    filled = max(0, min(10, int(percentage / 10)))
     
-    return f"Progress: {bar} {percentage:.1f}% ({completed}/{total})"
+    return f"Progress: {_BARS[filled]} {percentage:.1f}% ({completed}/{total})"
+
+# Potentially harmful characters, deleted in a single str.translate pass
+_SANITIZE_TABLE = str.maketrans("", "", "<>&\"';(){}")
 
 def sanitize_user_input(user_input: str) -> str:
     """Sanitize user input for security"""
-    # Remove potentially harmful characters
-    dangerous_chars = ['<', '>', '&', '"', "'", ';', '(', ')', '{', '}']
-    sanitized = user_input
-    
-    for char in dangerous_chars:
-        sanitized = sanitized.replace(char, '')
-    
-    return sanitized.strip()
+    return user_input.translate(_SANITIZE_TABLE).strip()
 
 def format_error_message(error: Exception) -> str:
     """Format error messages for user display"""
@@ -86,32 +95,25 @@ def format_error_message(error: Exception) -> str:
     return f"**{error_type}:** {error_message}"
 
 def create_code_diff(old_code: str, new_code: str) -> str:
-    """Create a simple diff between old and new code"""
-    old_lines = old_code.split('\n')
-    new_lines = new_code.split('\n')
-    
-    diff = "**Changes:**\n\n"
+    """Create a unified diff between old and new code"""
+    diff_lines = difflib.unified_diff(
+        old_code.splitlines(), new_code.splitlines(), fromfile="before", tofile="after", lineterm="", n=3
+    )
     
-    # Simple line-by-line comparison
-    max_lines = max(len(old_lines), len(new_lines))
+    diff = "\n".join(diff_lines)
     
-    for i in range(max_lines):
-        old_line = old_lines[i] if i < len(old_lines) else ""
-        new_line = new_lines[i] if i < len(new_lines) else ""
-        
-        if old_line != new_line:
-            if old_line:
-                diff += f"- {old_line}\n"
-            if new_line:
-                diff += f"+ {new_line}\n"
-    
-    return diff
+    # Fenced as a diff block so Markdown doesn't read ---/+++ lines as rules or headings
+    return "**Changes:**\n\n" + (format_code_block(diff, "diff") if diff else "")
+
+# Custom commands and selectors that need updating, matched in a single scan
+_MIGRATION_TOKENS = re.compile(r"Cypress\.Commands\.add|cy\.get\(|cy\.contains\(")
 
 def estimate_migration_effort(cypress_code: str) -> str:
     """Estimate migration effort based on code complexity"""
-    lines = len(cypress_code.split('\n'))
-    custom_commands = cypress_code.count('Cypress.Commands.add')
-    complex_selectors = cypress_code.count('cy.get(') + cypress_code.count('cy.contains(')
+    lines = cypress_code.count('\n') + 1
+    hits = Counter(_MIGRATION_TOKENS.findall(cypress_code))
+    custom_commands = hits['Cypress.Commands.add']
+    complex_selectors = hits['cy.get('] + hits['cy.contains(']
     
     if lines < 50 and custom_commands == 0:
         effort = "Low"